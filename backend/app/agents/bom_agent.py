@@ -2,11 +2,19 @@ import json
 import asyncio
 
 from groq import AsyncGroq
+from pydantic import ValidationError
 
 from app.core.config import settings
 from app.agents.exceptions import AgentException
-from app.models.bom import BomItem, AgentResponse
-from app.services.external_apis import search_digikey
+from app.models.bom import (
+    MAX_PRICE_BREAKS,
+    MAX_SELLER_OFFERS,
+    AgentResponse,
+    BomItem,
+    PriceBreak,
+    SellerOffer,
+)
+from app.services.external_apis import search_digikey, search_octopart
 
 EXTRACTION_PROMPT = """\
 You are an expert embedded-systems architect.
@@ -45,6 +53,56 @@ Return ONLY valid JSON. Do not include markdown.
 
 _client = AsyncGroq(api_key=settings.groq_api_key)
 
+# Bound concurrent Nexar lookups per BOM; each one spends paid API quota
+OCTOPART_CONCURRENCY = 4
+
+
+def _parse_price_breaks(tiers: list[dict]) -> list[PriceBreak]:
+    """Validate price tiers one by one, dropping malformed ones."""
+    price_breaks = []
+    for tier in tiers:
+        try:
+            price_breaks.append(PriceBreak(**tier))
+        except ValidationError:
+            continue
+    return price_breaks[:MAX_PRICE_BREAKS]
+
+
+def _parse_offers(octopart_result: dict | BaseException | None) -> list[SellerOffer]:
+    """Turn a search_octopart result into validated seller offers."""
+    if not isinstance(octopart_result, dict):
+        return []
+    offers = []
+    for offer in octopart_result.get("offers", []):
+        price_breaks = _parse_price_breaks(offer.get("priceBreaks", []))
+        if not price_breaks:
+            continue
+        try:
+            offers.append(SellerOffer(
+                seller=offer.get("seller", ""),
+                inventory_level=offer.get("inventoryLevel"),
+                price_breaks=price_breaks
+            ))
+        except ValidationError:
+            continue
+    return offers[:MAX_SELLER_OFFERS]
+
+
+async def _fetch_octopart_offers(part_numbers: list[str]) -> dict[str, list[SellerOffer]]:
+    """Look up Nexar seller offers once per distinct MPN, skipping if no key is configured."""
+    if not settings.octopart_api_key:
+        return {}
+
+    unique_parts = list(dict.fromkeys(pn for pn in part_numbers if pn))
+    semaphore = asyncio.Semaphore(OCTOPART_CONCURRENCY)
+
+    async def _lookup(mpn: str):
+        async with semaphore:
+            return await search_octopart(mpn)
+
+    results = await asyncio.gather(*(_lookup(mpn) for mpn in unique_parts), return_exceptions=True)
+    return {mpn: _parse_offers(result) for mpn, result in zip(unique_parts, results)}
+
 
 async def run_bom_agent(user_prompt: str, history: list[dict] = [], context: dict | None = None) -> AgentResponse:
     """3-Step Agentic orchestration for sourcing a BOM."""
@@ -88,9 +146,13 @@ async def run_bom_agent(user_prompt: str, history: list[dict] = [], context: dic
 
     # Step 2: API Execution
     api_results = {}
+    price_breaks = {}
     for query in search_queries:
         try:
             results = await search_digikey(query)
+            # Keep break tables out of the synthesis prompt; they are re-attached afterwards
+            for part in results:
+                price_breaks[part["partNumber"]] = part.pop("priceBreaks", [])
             api_results[query] = results
         except Exception as e:
             api_results[query] = {"error": str(e)}
@@ -129,6 +191,12 @@ async def run_bom_agent(user_prompt: str, history: list[dict] = [], context: dic
         raise AgentException("bom_agent", f"Response validation failed: {exc}") from exc
 
     if final_response.items:
+        # Carry DigiKey break tables and Octopart seller offers onto the items for the costing engine
+        octopart_offers = await _fetch_octopart_offers([item.part_number for item in final_response.items])
+        for item in final_response.items:
+            item.price_breaks = _parse_price_breaks(price_breaks.get(item.part_number, []))
+            item.offers = octopart_offers.get(item.part_number, [])
+
         computed_total = sum(item.quantity * item.estimated_cost for item in final_response.items)
         final_response.total_cost = round(computed_total, 2)
 
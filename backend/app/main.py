@@ -156,3 +156,32 @@ async def generate_pinmap(
         raise HTTPException(status_code=500, detail=str(e))
 
 app.include_router(pinmap_router)
+
+# ---------------------------------------------------------------------------
+# Costing router
+# ---------------------------------------------------------------------------
+from fastapi.concurrency import run_in_threadpool
+
+from app.models.bom import CostingRequest
+from app.services.costing import cost_bom
+
+costing_router = APIRouter(prefix="/api/costing", tags=["costing"])
+
+@costing_router.post("/")
+@limiter.limit("30/minute")
+async def cost_sweep(
+    request: Request,
+    costing_req: CostingRequest,
+    session_id: str = Depends(_validate_session_id),
+):
+    # Pure NumPy sweep over the request payload; no LLM or distributor calls.
+    # CPU-bound, so run it off the event loop.
+    result = await run_in_threadpool(
+        cost_bom,
+        items=costing_req.items,
+        build_quantities=costing_req.build_quantities,
+        offers=costing_req.offers,
+    )
+    return result.model_dump(by_alias=True)
+
+app.include_router(costing_router)
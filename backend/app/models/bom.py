@@ -1,6 +1,40 @@
 from datetime import datetime, timezone
+from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+# Caps on costing payloads; engine memory grows with parts x sellers x breaks x builds
+MAX_PRICE_BREAKS = 20
+MAX_SELLER_OFFERS = 8  # per part, BomItem.offers and request offers combined
+MAX_COSTING_ITEMS = 2000
+MAX_BUILD_QUANTITIES = 500
+MAX_COSTING_CELLS = 1_000_000  # items x sellers (incl. DigiKey) x build quantities
+
+# Value bounds keep every order quantity exact in float64 and within int64
+MAX_BREAK_QUANTITY = 1_000_000_000
+MAX_PART_QUANTITY = 100_000
+MAX_BUILD_QUANTITY = 1_000_000
+
+
+class PriceBreak(BaseModel):
+    """One tier of a distributor quantity-break price table."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    quantity: int = Field(..., ge=1, le=MAX_BREAK_QUANTITY, description="Minimum order quantity for this tier")
+    unit_price: float = Field(..., alias="unitPrice", ge=0, description="Unit price in USD at this tier")
+
+
+class SellerOffer(BaseModel):
+    """A single seller's price-break table for a part (from Octopart/Nexar)."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    seller: str = Field(..., description="Distributor name")
+    inventory_level: int | None = Field(None, alias="inventoryLevel", description="Units in stock")
+    price_breaks: list[PriceBreak] = Field(
+        default_factory=list, alias="priceBreaks", max_length=MAX_PRICE_BREAKS
+    )
 
 
 class BomItem(BaseModel):
@@ -11,10 +45,19 @@ class BomItem(BaseModel):
     part_number: str = Field(..., alias="partNumber", description="Manufacturer part number")
     manufacturer: str | None = Field(None, description="The manufacturer of the component")
     description: str = Field(..., description="Brief component description")
-    quantity: int = Field(..., ge=1, description="Number of units required")
+    quantity: int = Field(..., ge=1, le=MAX_PART_QUANTITY, description="Number of units required")
     estimated_cost: float = Field(
         ..., alias="estimatedCost", ge=0, description="Estimated unit cost in USD"
     )
+    price_breaks: list[PriceBreak] = Field(
+        default_factory=list,
+        alias="priceBreaks",
+        max_length=MAX_PRICE_BREAKS,
+        description="DigiKey quantity-break price table",
+    )
+    offers: list[SellerOffer] = Field(
+        default_factory=list, max_length=MAX_SELLER_OFFERS, description="Octopart/Nexar seller offers"
+    )
 
 
 class AgentResponse(BaseModel):
@@ -27,3 +70,68 @@ class AgentResponse(BaseModel):
     items: list[BomItem] | None = Field(None, description="List of BOM line-items, populated only if isReadyForBom is true")
     total_cost: float = Field(0.0, alias="totalCost", ge=0)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class CostingRequest(BaseModel):
+    """BOM costing sweep over a set of build quantities."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    items: list[BomItem] = Field(..., min_length=1, max_length=MAX_COSTING_ITEMS)
+    build_quantities: list[Annotated[int, Field(ge=1, le=MAX_BUILD_QUANTITY)]] = Field(
+        ...,
+        alias="buildQuantities",
+        min_length=1,
+        max_length=MAX_BUILD_QUANTITIES,
+        description="Number of boards to build",
+    )
+    offers: dict[str, Annotated[list[SellerOffer], Field(max_length=MAX_SELLER_OFFERS)]] = Field(
+        default_factory=dict,
+        max_length=MAX_COSTING_ITEMS,
+        description="Optional extra Nexar seller offers keyed by part number",
+    )
+
+    @model_validator(mode="after")
+    def _check_engine_budget(self) -> "CostingRequest":
+        n_sellers = 0
+        for item in self.items:
+            extra = len(item.offers) + len(self.offers.get(item.part_number, []))
+            if extra > MAX_SELLER_OFFERS:
+                raise ValueError(
+                    f"{item.part_number}: at most {MAX_SELLER_OFFERS} seller offers per part, got {extra}"
+                )
+            n_sellers = max(n_sellers, extra)
+
+        # One DigiKey/estimate table plus the seller offers, padded to the widest part
+        cells = len(self.items) * (n_sellers + 1) * len(self.build_quantities)
+        if cells > MAX_COSTING_CELLS:
+            raise ValueError(
+                f"Costing sweep too large: items x sellers x build quantities = {cells}, "
+                f"limit is {MAX_COSTING_CELLS}"
+            )
+        return self
+
+
+class CostingLine(BaseModel):
+    """Cost curve for one BOM line across the requested build quantities."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    part_number: str = Field(..., alias="partNumber")
+    order_quantities: list[int | None] = Field(
+        ..., alias="orderQuantities", description="Units actually purchased per build quantity; null if no seller has stock"
+    )
+    unit_prices: list[float | None] = Field(..., alias="unitPrices", description="Effective unit price per build quantity")
+    line_costs: list[float | None] = Field(..., alias="lineCosts")
+    sellers: list[str | None] = Field(..., description="Cheapest seller per build quantity")
+
+
+class CostingResponse(BaseModel):
+    """Per-line and total cost curves returned by the costing engine."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    build_quantities: list[int] = Field(..., alias="buildQuantities")
+    lines: list[CostingLine]
+    total_costs: list[float | None] = Field(..., alias="totalCosts", description="Null where any line cannot be filled")
+    cost_per_board: list[float | None] = Field(..., alias="costPerBoard")
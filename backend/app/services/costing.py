@@ -0,0 +1,153 @@
+import numpy as np
+
+from app.models.bom import MAX_COSTING_CELLS, BomItem, CostingLine, CostingResponse, SellerOffer
+
+# ---------------------------------------------------------------------------
+# Quantity-break BOM costing engine
+# ---------------------------------------------------------------------------
+# Every BOM line is expanded into a padded (parts x sellers x breaks) tensor of
+# break quantities and unit prices. A whole sweep of build quantities is then
+# priced with array operations only, so no LLM or distributor API is involved.
+
+DIGIKEY_SELLER = "DigiKey"
+ESTIMATE_SELLER = "Estimate"
+
+
+def _collect_offers(
+    item: BomItem, offers: dict[str, list[SellerOffer]]
+) -> list[tuple[str, list[tuple[int, float]], int | None]]:
+    """Return (seller, [(break_qty, unit_price), ...], stock) tables for one BOM line."""
+    tables = []
+    if item.price_breaks:
+        # DigiKey searches are already filtered to in-stock parts; stock level is not reported
+        tables.append((DIGIKEY_SELLER, [(pb.quantity, pb.unit_price) for pb in item.price_breaks], None))
+    for offer in item.offers + offers.get(item.part_number, []):
+        if offer.price_breaks:
+            breaks = [(pb.quantity, pb.unit_price) for pb in offer.price_breaks]
+            tables.append((offer.seller, breaks, offer.inventory_level))
+    if not tables:
+        # No distributor data: fall back to the synthesized flat unit cost
+        tables.append((ESTIMATE_SELLER, [(1, item.estimated_cost)], None))
+    return tables
+
+
+def _build_break_tensors(
+    items: list[BomItem], offers: dict[str, list[SellerOffer]]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[list[str]]]:
+    """Pack all price-break tables into inf-padded (parts x sellers x breaks) arrays.
+
+    Also returns a (parts x sellers) stock array, inf where the level is unknown.
+    """
+    tables = [_collect_offers(item, offers) for item in items]
+    n_sellers = max(len(t) for t in tables)
+    n_breaks = max(len(breaks) for t in tables for _, breaks, _ in t)
+
+    break_qty = np.full((len(items), n_sellers, n_breaks), np.inf)
+    unit_price = np.full((len(items), n_sellers, n_breaks), np.inf)
+    stock = np.full((len(items), n_sellers), np.inf)
+    seller_names = []
+    for p, part_tables in enumerate(tables):
+        names = []
+        for s, (seller, breaks, inventory) in enumerate(part_tables):
+            names.append(seller)
+            qty, price = zip(*breaks)
+            break_qty[p, s, : len(breaks)] = qty
+            unit_price[p, s, : len(breaks)] = price
+            if inventory is not None:
+                stock[p, s] = inventory
+        seller_names.append(names)
+
+    return break_qty, unit_price, stock, seller_names
+
+
+def _cheapest_offer(
+    need: np.ndarray, break_qty: np.ndarray, unit_price: np.ndarray, stock: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return (cost, order qty, seller index) of the cheapest offer per (parts x builds)."""
+    # Walk the break axis keeping the cheapest tier per seller. Each step is
+    # vectorized over (parts x sellers x builds); looping over the handful of
+    # breaks avoids materializing a 4-D array for large sweeps.
+    seller_cost = np.full(break_qty.shape[:2] + need.shape[1:], np.inf)
+    seller_order = np.zeros_like(seller_cost)
+    for k in range(break_qty.shape[2]):
+        order = np.maximum(need[:, None, :], break_qty[:, :, k, None])
+        cost = np.where(order > stock[:, :, None], np.inf, order * unit_price[:, :, k, None])
+        cheaper = cost < seller_cost
+        seller_cost = np.where(cheaper, cost, seller_cost)
+        seller_order = np.where(cheaper, order, seller_order)
+
+    best_seller = seller_cost.argmin(axis=1)
+    line_costs = np.take_along_axis(seller_cost, best_seller[:, None, :], axis=1)[:, 0, :]
+    order_qty = np.take_along_axis(seller_order, best_seller[:, None, :], axis=1)[:, 0, :]
+    return line_costs, order_qty, best_seller
+
+
+def _nullify(values: np.ndarray, mask: np.ndarray) -> list:
+    """Convert to nested lists with None wherever mask is False."""
+    return np.where(mask, values.astype(object), None).tolist()
+
+
+def cost_bom(
+    items: list[BomItem],
+    build_quantities: list[int],
+    offers: dict[str, list[SellerOffer]] | None = None,
+) -> CostingResponse:
+    """Price a BOM across many build quantities at once.
+
+    For each line the engine picks, per build quantity, the seller and break
+    tier that give the lowest extended cost. Ordering up to a higher break (or
+    up to a seller's minimum order quantity) is allowed when it is cheaper
+    than buying exactly the required units. Tiers whose order quantity exceeds
+    a seller's reported stock are skipped; build quantities that no seller can
+    fill come back as null costs.
+    """
+    offers = offers or {}
+    builds = np.asarray(build_quantities, dtype=float)
+    per_board = np.array([item.quantity for item in items], dtype=float)
+    break_qty, unit_price, stock, seller_names = _build_break_tensors(items, offers)
+
+    # Units required per line for every build quantity: (parts x builds)
+    need = per_board[:, None] * builds[None, :]
+
+    # Sweep build quantities in chunks so temporaries stay within the cell budget
+    chunk = max(1, MAX_COSTING_CELLS // (break_qty.shape[0] * break_qty.shape[1]))
+    chunks = [
+        _cheapest_offer(need[:, start : start + chunk], break_qty, unit_price, stock)
+        for start in range(0, need.shape[1], chunk)
+    ]
+    line_costs, order_qty, best_seller = (np.concatenate(parts, axis=1) for parts in zip(*chunks))
+
+    # Cheapest seller per line and build quantity: (parts x builds)
+    filled = np.isfinite(line_costs)
+    with np.errstate(invalid="ignore"):
+        effective_price = line_costs / order_qty
+
+    total_costs = line_costs.sum(axis=0)
+    cost_per_board = total_costs / builds
+
+    # Round and resolve seller names in bulk before handing rows to pydantic;
+    # unfilled entries become None so the response stays JSON-serializable
+    names = np.array([n + [""] * (break_qty.shape[1] - len(n)) for n in seller_names], dtype=object)
+    sellers = _nullify(np.take_along_axis(names, best_seller, axis=1), filled)
+    order_rows = _nullify(np.where(filled, order_qty, 0).astype(int), filled)
+    price_rows = _nullify(np.round(effective_price, 4), filled)
+    cost_rows = _nullify(np.round(line_costs, 2), filled)
+    totals_filled = filled.all(axis=0)
+
+    lines = [
+        CostingLine(
+            part_number=item.part_number,
+            order_quantities=order_rows[p],
+            unit_prices=price_rows[p],
+            line_costs=cost_rows[p],
+            sellers=sellers[p],
+        )
+        for p, item in enumerate(items)
+    ]
+
+    return CostingResponse(
+        build_quantities=list(build_quantities),
+        lines=lines,
+        total_costs=_nullify(np.round(total_costs, 2), totals_filled),
+        cost_per_board=_nullify(np.round(cost_per_board, 4), totals_filled),
+    )
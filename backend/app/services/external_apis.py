@@ -73,11 +73,20 @@ async def search_digikey(keywords: str) -> list[dict]:
             if pricing:
                 cost = pricing[0].get("UnitPrice", 0.0)
 
+            # Keep the full break table so the costing engine can price any build quantity.
+            # Tiers missing a quantity or price are skipped rather than defaulted to free.
+            price_breaks = [
+                {"quantity": tier["BreakQuantity"], "unitPrice": tier["UnitPrice"]}
+                for tier in pricing
+                if tier.get("BreakQuantity") is not None and tier.get("UnitPrice") is not None
+            ]
+
             results.append({
                 "partNumber": product.get("ManufacturerPartNumber", ""),
                 "manufacturer": product.get("Manufacturer", {}).get("Value", ""),
                 "description": product.get("ProductDescription", ""),
-                "unitPrice": cost
+                "unitPrice": cost,
+                "priceBreaks": price_breaks
             })
             
         return results
@@ -85,6 +94,8 @@ async def search_digikey(keywords: str) -> list[dict]:
 # ---------------------------------------------------------------------------
 # Octopart (Nexar) API Integration
 # ---------------------------------------------------------------------------
+_OCTOPART_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
 async def search_octopart(mpn: str) -> dict | None:
     """Fetch real-time stock and pricing for an MPN using Nexar GraphQL."""
     url = "https://api.nexar.com/graphql"
@@ -109,6 +120,7 @@ async def search_octopart(mpn: str) -> dict | None:
               }
               offers {
                 prices {
+                  quantity
                   price
                   currency
                 }
@@ -126,7 +138,7 @@ async def search_octopart(mpn: str) -> dict | None:
         "variables": {"mpn": mpn}
     }
 
-    async with httpx.AsyncClient() as client:
+    async with httpx.AsyncClient(timeout=_OCTOPART_TIMEOUT) as client:
         response = await client.post(url, headers=headers, json=payload)
         
         if response.status_code != 200:
@@ -149,11 +161,33 @@ async def search_octopart(mpn: str) -> dict | None:
                 if best_price > 0:
                     break
 
+            # Full USD break table per in-stock seller, for cheapest-seller costing
+            offers = []
+            for seller in part.get("sellers", []):
+                seller_name = seller.get("company", {}).get("name", "")
+                for offer in seller.get("offers", []):
+                    if offer.get("inventoryLevel", 0) <= 0:
+                        continue
+                    price_breaks = [
+                        {"quantity": price["quantity"], "unitPrice": price["price"]}
+                        for price in offer.get("prices", [])
+                        if price.get("currency") == "USD"
+                        and price.get("quantity") is not None
+                        and price.get("price") is not None
+                    ]
+                    if price_breaks:
+                        offers.append({
+                            "seller": seller_name,
+                            "inventoryLevel": offer.get("inventoryLevel", 0),
+                            "priceBreaks": price_breaks
+                        })
+
             return {
                 "partNumber": part.get("mpn", ""),
                 "manufacturer": part.get("manufacturer", {}).get("name", ""),
                 "description": part.get("shortDescription", ""),
-                "unitPrice": best_price
+                "unitPrice": best_price,
+                "offers": offers
             }
         except (KeyError, IndexError):
             return None
@@ -0,0 +1,66 @@
+import pytest
+
+from app.agents import bom_agent
+from app.agents.bom_agent import _fetch_octopart_offers, _parse_offers, _parse_price_breaks
+
+
+def test_parse_price_breaks_drops_malformed_tiers():
+    tiers = [
+        {"quantity": 1, "unitPrice": 0.5},
+        {"quantity": 0, "unitPrice": 0.4},
+        {"quantity": 10, "unitPrice": None},
+        {"quantity": 100, "unitPrice": -1.0},
+        {"unitPrice": 0.2},
+        {"quantity": 1000, "unitPrice": 0.1},
+    ]
+
+    price_breaks = _parse_price_breaks(tiers)
+
+    assert [(pb.quantity, pb.unit_price) for pb in price_breaks] == [(1, 0.5), (1000, 0.1)]
+
+
+def test_parse_offers_drops_bad_offers():
+    result = {
+        "offers": [
+            {"seller": "Mouser", "inventoryLevel": 50, "priceBreaks": [{"quantity": 1, "unitPrice": 1.0}]},
+            {"seller": "Arrow", "inventoryLevel": 10, "priceBreaks": [{"quantity": 0, "unitPrice": 1.0}]},
+            {"seller": "Avnet", "inventoryLevel": "lots", "priceBreaks": [{"quantity": 1, "unitPrice": 0.9}]},
+        ]
+    }
+
+    offers = _parse_offers(result)
+
+    assert [(o.seller, o.inventory_level) for o in offers] == [("Mouser", 50)]
+
+
+@pytest.mark.parametrize("result", [None, RuntimeError("timeout"), {}])
+def test_parse_offers_handles_missing_results(result):
+    assert _parse_offers(result) == []
+
+
+@pytest.mark.asyncio
+async def test_octopart_lookup_skipped_without_api_key(monkeypatch):
+    async def _fail(mpn):
+        raise AssertionError("search_octopart should not be called")
+
+    monkeypatch.setattr(bom_agent.settings, "octopart_api_key", "")
+    monkeypatch.setattr(bom_agent, "search_octopart", _fail)
+
+    assert await _fetch_octopart_offers(["STM32WLE5", "RC0402"]) == {}
+
+
+@pytest.mark.asyncio
+async def test_octopart_lookup_deduplicates_part_numbers(monkeypatch):
+    calls = []
+
+    async def _search(mpn):
+        calls.append(mpn)
+        return {"offers": [{"seller": "Mouser", "priceBreaks": [{"quantity": 1, "unitPrice": 2.0}]}]}
+
+    monkeypatch.setattr(bom_agent.settings, "octopart_api_key", "test-key")
+    monkeypatch.setattr(bom_agent, "search_octopart", _search)
+
+    offers = await _fetch_octopart_offers(["STM32WLE5", "RC0402", "STM32WLE5", ""])
+
+    assert sorted(calls) == ["RC0402", "STM32WLE5"]
+    assert offers["STM32WLE5"][0].seller == "Mouser"
@@ -0,0 +1,112 @@
+import pytest
+from pydantic import ValidationError
+
+from app.models.bom import MAX_BUILD_QUANTITIES, BomItem, CostingRequest, SellerOffer
+from app.services.costing import cost_bom
+
+
+def _item(part_number: str, quantity: int = 1, estimated_cost: float = 1.0, breaks=(), offers=()) -> BomItem:
+    return BomItem(
+        partNumber=part_number,
+        description="test part",
+        quantity=quantity,
+        estimatedCost=estimated_cost,
+        priceBreaks=[{"quantity": q, "unitPrice": p} for q, p in breaks],
+        offers=list(offers),
+    )
+
+
+def _offer(seller: str, breaks, inventory_level: int | None = None) -> SellerOffer:
+    return SellerOffer(
+        seller=seller,
+        inventoryLevel=inventory_level,
+        priceBreaks=[{"quantity": q, "unitPrice": p} for q, p in breaks],
+    )
+
+
+def test_picks_break_tier_for_order_quantity():
+    item = _item("R1", breaks=[(1, 0.10), (100, 0.05), (1000, 0.04)])
+
+    result = cost_bom([item], [40, 500, 2000])
+    line = result.lines[0]
+
+    assert line.unit_prices == [0.10, 0.05, 0.04]
+    assert line.line_costs == [4.0, 25.0, 80.0]
+    assert line.order_quantities == [40, 500, 2000]
+    assert line.sellers == ["DigiKey"] * 3
+
+
+def test_orders_up_to_cheaper_break_or_minimum_quantity():
+    # 8 units at $1.00 cost more than 10 units at $0.50
+    item = _item("C1", quantity=2, breaks=[(1, 1.0), (10, 0.5)])
+    # Reel-only part: a single board still has to buy the minimum order quantity
+    reel = _item("C2", breaks=[(100, 0.01)])
+
+    result = cost_bom([item, reel], [1, 4])
+
+    assert result.lines[0].order_quantities == [2, 10]
+    assert result.lines[0].line_costs == [2.0, 5.0]
+    assert result.lines[1].order_quantities == [100, 100]
+    assert result.lines[1].line_costs == [1.0, 1.0]
+
+
+def test_picks_cheapest_seller_within_stock():
+    item = _item(
+        "U1",
+        breaks=[(1, 2.0)],
+        offers=[_offer("Mouser", [(1, 1.0)], inventory_level=5)],
+    )
+
+    result = cost_bom([item], [5, 6, 10])
+    line = result.lines[0]
+
+    assert line.sellers == ["Mouser", "DigiKey", "DigiKey"]
+    assert line.line_costs == [5.0, 12.0, 20.0]
+
+
+def test_request_offers_are_merged_and_unfillable_builds_are_null():
+    item = _item("U2", estimated_cost=9.0)
+    offers = {"U2": [_offer("Arrow", [(1, 3.0)], inventory_level=4)]}
+
+    result = cost_bom([item], [2, 5], offers)
+
+    assert result.lines[0].sellers == ["Arrow", None]
+    assert result.lines[0].line_costs == [6.0, None]
+    assert result.total_costs == [6.0, None]
+    assert result.cost_per_board == [3.0, None]
+
+
+def test_falls_back_to_estimated_cost():
+    item = _item("X1", quantity=3, estimated_cost=0.25)
+
+    result = cost_bom([item], [1, 10])
+
+    assert result.lines[0].sellers == ["Estimate", "Estimate"]
+    assert result.lines[0].line_costs == [0.75, 7.5]
+
+
+def test_pads_parts_with_different_seller_and_break_counts():
+    items = [
+        _item("A", estimated_cost=1.0),
+        _item("B", breaks=[(1, 0.5), (10, 0.4), (100, 0.3), (1000, 0.2)]),
+        _item(
+            "C",
+            breaks=[(1, 3.0)],
+            offers=[_offer("Mouser", [(1, 2.5)]), _offer("Arrow", [(1, 2.0), (50, 1.0)])],
+        ),
+    ]
+
+    result = cost_bom(items, [1, 100])
+
+    assert [line.line_costs for line in result.lines] == [[1.0, 100.0], [0.5, 30.0], [2.0, 100.0]]
+    assert result.lines[2].sellers == ["Arrow", "Arrow"]
+    assert result.total_costs == [3.5, 230.0]
+    assert result.cost_per_board == [3.5, 2.3]
+
+
+def test_costing_request_caps_build_quantities():
+    with pytest.raises(ValidationError):
+        CostingRequest(
+            items=[_item("A")],
+            buildQuantities=list(range(1, MAX_BUILD_QUANTITIES + 2)),
+        )
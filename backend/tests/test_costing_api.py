@@ -0,0 +1,79 @@
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.bom import MAX_SELLER_OFFERS
+
+client = TestClient(app)
+
+
+def _post(payload: dict):
+    return client.post("/api/costing/", json=payload, headers={"X-Session-ID": str(uuid4())})
+
+
+def test_costing_endpoint_round_trips_aliases():
+    response = _post({
+        "items": [{
+            "partNumber": "RC0402",
+            "description": "10k resistor",
+            "quantity": 4,
+            "estimatedCost": 0.1,
+            "priceBreaks": [{"quantity": 1, "unitPrice": 0.1}, {"quantity": 100, "unitPrice": 0.01}],
+            "offers": [{"seller": "Mouser", "inventoryLevel": 1000, "priceBreaks": [{"quantity": 1, "unitPrice": 0.05}]}],
+        }],
+        "buildQuantities": [1, 50],
+    })
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body == {
+        "buildQuantities": [1, 50],
+        "lines": [{
+            "partNumber": "RC0402",
+            "orderQuantities": [4, 200],
+            "unitPrices": [0.05, 0.01],
+            "lineCosts": [0.2, 2.0],
+            "sellers": ["Mouser", "DigiKey"],
+        }],
+        "totalCosts": [0.2, 2.0],
+        "costPerBoard": [0.2, 0.04],
+    }
+
+
+def test_costing_endpoint_rejects_oversized_quantities():
+    response = _post({
+        "items": [{"partNumber": "X", "description": "x", "quantity": 10**10, "estimatedCost": 1.0}],
+        "buildQuantities": [10**10],
+    })
+
+    assert response.status_code == 422
+
+
+def test_costing_endpoint_caps_combined_seller_offers():
+    offer = {"seller": "Mouser", "priceBreaks": [{"quantity": 1, "unitPrice": 1.0}]}
+    response = _post({
+        "items": [{
+            "partNumber": "X",
+            "description": "x",
+            "quantity": 1,
+            "estimatedCost": 1.0,
+            "offers": [offer] * MAX_SELLER_OFFERS,
+        }],
+        "buildQuantities": [1],
+        "offers": {"X": [offer]},
+    })
+
+    assert response.status_code == 422
+
+
+def test_costing_endpoint_caps_total_sweep_size():
+    offer = {"seller": "Mouser", "priceBreaks": [{"quantity": 1, "unitPrice": 1.0}]}
+    items = [
+        {"partNumber": f"P{i}", "description": "x", "quantity": 1, "estimatedCost": 1.0, "offers": [offer]}
+        for i in range(2000)
+    ]
+
+    response = _post({"items": items, "buildQuantities": list(range(1, 501))})
+
+    assert response.status_code == 422
@@ -0,0 +1,80 @@
+import httpx
+import pytest
+
+from app.services import external_apis
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """Route every httpx.AsyncClient through a MockTransport returning the given JSON."""
+    real_client = httpx.AsyncClient
+
+    def _install(payload: dict):
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=payload))
+        monkeypatch.setattr(
+            external_apis.httpx, "AsyncClient", lambda **kwargs: real_client(transport=transport, **kwargs)
+        )
+
+    return _install
+
+
+@pytest.mark.asyncio
+async def test_search_digikey_keeps_full_break_table(mock_http, monkeypatch):
+    monkeypatch.setattr(external_apis, "_digikey_token", "token")
+    mock_http({
+        "Products": [{
+            "ManufacturerPartNumber": "RC0402FR-0710KL",
+            "Manufacturer": {"Value": "YAGEO"},
+            "ProductDescription": "RES 10K OHM 1% 1/16W 0402",
+            "StandardPricing": [
+                {"BreakQuantity": 1, "UnitPrice": 0.1},
+                {"BreakQuantity": 10, "UnitPrice": None},
+                {"UnitPrice": 0.02},
+                {"BreakQuantity": 100, "UnitPrice": 0.01},
+            ],
+        }]
+    })
+
+    results = await external_apis.search_digikey("10k 0402 resistor")
+
+    assert results[0]["unitPrice"] == 0.1
+    assert results[0]["priceBreaks"] == [
+        {"quantity": 1, "unitPrice": 0.1},
+        {"quantity": 100, "unitPrice": 0.01},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_octopart_builds_in_stock_usd_offers(mock_http):
+    mock_http({
+        "data": {"supSearch": {"results": [{"part": {
+            "mpn": "STM32WLE5JCI6",
+            "manufacturer": {"name": "STMicroelectronics"},
+            "shortDescription": "LoRa MCU",
+            "sellers": [
+                {"company": {"name": "Mouser"}, "offers": [{
+                    "inventoryLevel": 120,
+                    "prices": [
+                        {"quantity": 1, "price": 6.5, "currency": "USD"},
+                        {"quantity": 10, "price": 5.9, "currency": "EUR"},
+                        {"quantity": 100, "price": None, "currency": "USD"},
+                        {"price": 4.0, "currency": "USD"},
+                        {"quantity": 250, "price": 4.8, "currency": "USD"},
+                    ],
+                }]},
+                {"company": {"name": "Arrow"}, "offers": [{
+                    "inventoryLevel": 0,
+                    "prices": [{"quantity": 1, "price": 5.0, "currency": "USD"}],
+                }]},
+            ],
+        }}]}}
+    })
+
+    result = await external_apis.search_octopart("STM32WLE5JCI6")
+
+    assert result["unitPrice"] == 6.5
+    assert result["offers"] == [{
+        "seller": "Mouser",
+        "inventoryLevel": 120,
+        "priceBreaks": [{"quantity": 1, "unitPrice": 6.5}, {"quantity": 250, "unitPrice": 4.8}],
+    }]